@@ -1,14 +1,20 @@
 import os
 import sys
 import json
+import statistics
 import time
+import threading
+import sqlite3
 import click
-import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from tqdm import tqdm
 from spotipy import Spotify
 from spotipy.oauth2 import SpotifyOAuth
 from dotenv import load_dotenv
 import unicodedata
+from functools import lru_cache, wraps
+from bisect import bisect_right
+from itertools import islice
 from PIL import Image
 import base64
 import io
@@ -22,39 +28,164 @@ SPOTIPY_REDIRECT_URI = os.getenv('SPOTIPY_REDIRECT_URI')
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
 
-def print_debug(msg, debug):
-    if debug:
-        click.echo(f"[DEBUG] {msg}")
+# Concurrent Spotify requests; 429 responses are retried by spotipy honoring Retry-After
+MAX_WORKERS = 8
+MAX_RETRIES = 10
+MAX_REQUESTS_PER_SECOND = 10
+ARTISTS_BATCH_SIZE = 50  # max ids accepted by GET /v1/artists
+
+# On-disk cache of Spotify responses, so re-running a festival skips most requests
+CACHE_PATH = os.path.join(DATA_DIR, ".cache", "spotify.sqlite3")
+SEARCH_CACHE_TTL = 7 * 24 * 60 * 60  # name -> id only, popularity is refreshed in batches
+TOP_TRACKS_CACHE_TTL = 24 * 60 * 60
+
+def _print_debug(msg, *args):
+    click.echo("[DEBUG] " + (msg % args if args else msg))
+
+def _skip_debug(msg, *args):
+    pass
+
+# Rebound once by enable_debug; arguments are only formatted when debug output is on
+print_debug = _skip_debug
+
+def enable_debug(debug):
+    global print_debug
+    print_debug = _print_debug if debug else _skip_debug
+
+def with_progress(results, total, desc, every=10):
+    """Yields results, rewriting a single counter line every `every` items (lighter than tqdm)"""
+    for i, result in enumerate(results, 1):
+        if i % every == 0 or i == total:
+            click.echo(f"\r{desc}: [{i}/{total}]", nl=i == total)
+        yield result
+
+class RateLimiter:
+    """Leaky bucket shared between threads: spaces calls evenly at max_rate per time_period"""
+    def __init__(self, max_rate, time_period=1.0):
+        self.interval = time_period / max_rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+spotify_limiter = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+def strip_accents(text: str) -> str:
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', text)
+        if not unicodedata.combining(c)
+    )
+
+# Latin-1 Supplement and Latin Extended-A/B (U+0080..U+024F) mapped to their accent-free form,
+# so most festival names are normalized with a single str.translate instead of NFD
+LATIN_END = '\u0250'
+LATIN_TABLE = str.maketrans({
+    chr(cp): strip_accents(chr(cp))
+    for cp in range(0x80, ord(LATIN_END))
+    if strip_accents(chr(cp)) != chr(cp)
+})
+
+@lru_cache(maxsize=100_000)
+def normalize(text: str) -> str:
+    """Normalize string: remove accents and casefold"""
+    if text.isascii():
+        return text.lower()  # same as casefold for ASCII
+    if max(text) < LATIN_END:
+        return text.translate(LATIN_TABLE).casefold()
+    return strip_accents(text).casefold()
+
+_cache_lock = threading.Lock()
+_cache_conn = None
+_CACHE_MISS = object()
+_CACHE_ERRORS = (sqlite3.Error, OSError, ValueError)
+
+def _cache_connection():
+    """Opens the shared cache connection on first use; callers must hold _cache_lock"""
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, timeout=30, check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, ts REAL)")
+        _cache_conn = conn
+    return _cache_conn
+
+def cache_get(key, ttl):
+    try:
+        with _cache_lock:
+            row = _cache_connection().execute("SELECT value, ts FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > ttl:
+            return _CACHE_MISS
+        return json.loads(row[0])
+    except _CACHE_ERRORS:
+        return _CACHE_MISS
+
+def cache_set(key, value):
+    try:
+        with _cache_lock:
+            conn = _cache_connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                    (key, json.dumps(value), time.time()),
+                )
+    except _CACHE_ERRORS:
+        pass  # the cache is best effort, never fail a run because of it
+
+def cached(kind, ttl, key=normalize, cache_if=None):
+    """
+    Caches func(sp, arg) on disk under (kind, key(arg)) for ttl seconds.
+    If given, only results for which cache_if(result) is true are stored.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(sp, arg):
+            cache_key = f"{kind}:{key(arg)}"
+            value = cache_get(cache_key, ttl)
+            if value is _CACHE_MISS:
+                value = func(sp, arg)
+                if cache_if is None or cache_if(value):
+                    cache_set(cache_key, value)
+            return value
+        return wrapper
+    return decorator
 
 def validate_artists_json(path):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
         if not isinstance(data, dict):
             return False, "JSON root is not an object"
         if "artists" not in data:
             return False, '"artists" key not found'
-        if not isinstance(data["artists"], list):
+        artists = data["artists"]
+        if not isinstance(artists, list):
             return False, '"artists" is not a list'
-        if not all(isinstance(artist, str) for artist in data["artists"]):
+        if not all(type(artist) is str for artist in artists):
             return False, "All artists must be strings"
-        return True, data["artists"]
+        return True, artists
     except Exception as e:
         return False, str(e)
 
 def list_festivals():
     if not os.path.exists(DATA_DIR):
         return []
-    items = [
-        d for d in os.listdir(DATA_DIR)
-        if os.path.isdir(os.path.join(DATA_DIR, d)) and not d.startswith('.')
-    ]
+    with os.scandir(DATA_DIR) as entries:
+        items = [
+            entry.name for entry in entries
+            if entry.is_dir() and not entry.name.startswith('.')
+        ]
     return sorted(items)
 
 def get_artists_path(festival_dir):
     return os.path.join(DATA_DIR, festival_dir, "artists.json")
 
-def select_festival(debug=False):
+def select_festival():
     while True:
         festivals = list_festivals()
         if not festivals:
@@ -71,7 +202,7 @@ def select_festival(debug=False):
         artists_path = get_artists_path(selected_festival)
         is_valid, artists_or_err = validate_artists_json(artists_path)
         if is_valid:
-            print_debug(f"Selected festival: {selected_festival}", debug)
+            print_debug("Selected festival: %s", selected_festival)
             return selected_festival, artists_or_err
         else:
             click.echo(f"Error: {artists_or_err}")
@@ -79,7 +210,7 @@ def select_festival(debug=False):
             click.echo("Please choose another festival.\n")
             continue
 
-def ask_for_inputs(playlist_name, code, sp_oauth, debug=False):
+def ask_for_inputs(playlist_name, code, sp_oauth):
     if not playlist_name:
         playlist_name = click.prompt("Enter playlist name", type=str)
     # If code not provided, print auth URL and ask for code
@@ -88,144 +219,170 @@ def ask_for_inputs(playlist_name, code, sp_oauth, debug=False):
         click.echo("\nTo authorize the app, open the following URL in your browser, log in, and then paste the code parameter you receive here:")
         click.echo(auth_url)
         code = click.prompt("\nPaste the 'code' parameter here", type=str)
-    print_debug(f"Playlist name: {playlist_name}", debug)
-    print_debug(f"Spotify code: {code}", debug)
+    print_debug("Playlist name: %s", playlist_name)
+    print_debug("Spotify code: %s", code)
     return playlist_name, code
 
-def create_spotify_client(code, sp_oauth, debug=False):
+def create_spotify_client(code, sp_oauth):
     if not (SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET and SPOTIPY_REDIRECT_URI):
         click.echo("Spotify credentials are not set in the .env file.")
         sys.exit(1)
     token_info = sp_oauth.get_access_token(code=code, as_dict=False)
-    print_debug(f"Token info: {token_info}", debug)
-    return Spotify(auth=token_info)
-
-def fetch_artist_popularity(sp, artists, debug=False):
-    artist_popularity = {}
-    click.echo("\n📊 Getting artist popularity...")
-    for name in tqdm(artists, desc="Getting popularity"):
-        res = sp.search(q=f"artist:{name}", type="artist", limit=1)
-        items = res["artists"]["items"]
-        artist_popularity[name] = items[0]["popularity"] if items else None
-        time.sleep(0.2)
-        if debug:
-            print_debug(f"Artist '{name}' popularity: {artist_popularity[name]}", debug)
-    return artist_popularity
-
-def fetch_artist_top_tracks(sp, artist_name, debug=False):
-    res = sp.search(q=f"artist:{artist_name}", type="artist", limit=1)
+    print_debug("Token info: %s", token_info)
+    return Spotify(auth=token_info, retries=MAX_RETRIES, status_retries=MAX_RETRIES)
+
+# Misses are not cached, so a missing or misspelled artist is searched again on the next run
+@cached("search", SEARCH_CACHE_TTL, cache_if=lambda info: info["id"] is not None)
+def search_artist(sp, name):
+    spotify_limiter.wait()
+    res = sp.search(q=f"artist:{name}", type="artist", limit=1)
     items = res["artists"]["items"]
     if not items:
-        if debug:
-            print_debug(f"Artist '{artist_name}' not found in Spotify", debug)
-        return []
-    found_artist = items[0]["name"]
+        return {"popularity": None, "id": None, "matched_name": None}
+    return {"popularity": items[0]["popularity"], "id": items[0]["id"], "matched_name": items[0]["name"]}
+
+def fetch_popularity_by_id(sp, artist_ids):
+    """Returns {artist_id: popularity} using batched GET /v1/artists calls"""
+    popularity = {}
+    for chunk in chunked(artist_ids, ARTISTS_BATCH_SIZE):
+        spotify_limiter.wait()
+        for artist in sp.artists(chunk)["artists"]:
+            if artist:
+                popularity[artist["id"]] = artist["popularity"]
+    return popularity
+
+def fetch_artist_popularity(sp, artists):
+    """
+    Resolves every artist once (searches are cached) and returns {name: {"popularity", "id", "matched_name"}}.
+    Popularity is then refreshed for all resolved ids in batches of ARTISTS_BATCH_SIZE.
+    """
+    click.echo("\n📊 Getting artist popularity...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(lambda name: search_artist(sp, name), artists)
+        search_results = dict(zip(artists, with_progress(results, len(artists), "Resolving artists")))
+    artist_ids = list(dict.fromkeys(info["id"] for info in search_results.values() if info["id"]))
+    popularity = fetch_popularity_by_id(sp, artist_ids)
+    artist_info = {}
+    for name, info in search_results.items():
+        artist_info[name] = {**info, "popularity": popularity.get(info["id"], info["popularity"])}
+        print_debug("Artist '%s' popularity: %s", name, artist_info[name]["popularity"])
+    return artist_info
+
+def get_strict_artist_id(artist_name, info):
+    """Returns the Spotify id only if the search result matches the artist name strictly"""
+    found_artist = info["matched_name"]
+    if found_artist is None:
+        print_debug("Artist '%s' not found in Spotify", artist_name)
+        return None
     if normalize(found_artist) != normalize(artist_name):
-        if debug:
-            print_debug(f"Artist '{artist_name}' not matched strictly. Found '{found_artist}'", debug)
-        return []
-    artist_id = items[0]["id"]
-    tracks = sp.artist_top_tracks(artist_id)["tracks"]
-    top_track_ids = [track["id"] for track in tracks]
-    if debug:
-        print_debug(f"Artist '{artist_name}' top tracks: {top_track_ids}", debug)
-    return top_track_ids
+        print_debug("Artist '%s' not matched strictly. Found '%s'", artist_name, found_artist)
+        return None
+    return info["id"]
+
+@cached("top_tracks", TOP_TRACKS_CACHE_TTL, key=str)
+def fetch_artist_top_tracks(sp, artist_id):
+    spotify_limiter.wait()
+    return sp.artist_top_tracks(artist_id)["tracks"]
+
+def fetch_all_top_tracks(sp, artist_ids):
+    """
+    Fetches top tracks for {artist_name: artist_id} concurrently, returns {artist_name: tracks}.
+    """
+    names = list(artist_ids)
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(lambda name: fetch_artist_top_tracks(sp, artist_ids[name]), names)
+        return dict(zip(names, with_progress(results, len(names), "Fetching tracks")))
 
 def get_percentile_thresholds(popularities):
-    p20, p40, p60, p80 = np.percentile(popularities, [20, 40, 60, 80])
+    # "inclusive" interpolates linearly between closest ranks, like numpy's default percentile
+    if len(popularities) == 1:
+        return tuple(popularities) * 4
+    p20, p40, p60, p80 = statistics.quantiles(popularities, n=5, method="inclusive")
     return p20, p40, p60, p80
 
-def songs_count(p, p20, p40, p60, p80):
-    if p is None:
-        p = 0
-    if p < p20:
-        return 1
-    elif p < p40:
-        return 2
-    elif p < p60:
-        return 3
-    elif p < p80:
-        return 4
-    else:
-        return 5
+def songs_count(p, thresholds):
+    """1 song below the 20th percentile, one more for each threshold reached (up to 5)"""
+    return bisect_right(thresholds, p if p is not None else 0) + 1
     
-def normalize(text: str) -> str: 
-    """Normalize string: remove accents and lowercase"""
-    return ''.join(
-        c for c in unicodedata.normalize('NFD', text)
-        if unicodedata.category(c) != 'Mn'
-    ).lower()
-
-
-def select_tracks_by_percentile_logic(sp, artists, debug=False):
+def add_rejected_track(rejected, track_id, reason, authors=None, owner=None):
+    """Debug buffer of rejected tracks, kept as parallel lists (id, reason, authors, owner)"""
+    rejected["id"].append(track_id)
+    rejected["reason"].append(reason)
+    rejected["authors"].append(authors)
+    rejected["owner"].append(owner)
+
+def get_artist_preference(artists):
+    """Maps normalized artist names to their order of preference (index in artists)"""
+    return {norm: i for i, norm in enumerate(map(normalize, artists))}
+
+def select_tracks_by_percentile_logic(sp, artists, artist_preference, debug=False):
     """
     Assigns tracks to the first artist in the track's artists list that also appears in the user's artist list (artists.json).
     Each track is only assigned once (to the owner artist).
     The comparison is accent-insensitive and case-insensitive.
+    artist_preference comes from get_artist_preference(artists).
     """
-    # Map normalized artist names to their order of preference (index) for quick lookup
-    artist_preference = {normalize(name): i for i, name in enumerate(artists)}
-    # Also keep a mapping from normalized to original for debug clarity
-    artist_name_map = {normalize(name): name for name in artists}
-
-    artist_popularity = fetch_artist_popularity(sp, artists, debug=debug)
+    artist_info = fetch_artist_popularity(sp, artists)
+    artist_popularity = {a: artist_info[a]["popularity"] for a in artists}
     popularity_values = [
         artist_popularity[a] if artist_popularity[a] is not None else 0 for a in artists
     ]
-    p20, p40, p60, p80 = get_percentile_thresholds(popularity_values)
-    to_extract = {
-        a: songs_count(artist_popularity[a], p20, p40, p60, p80) for a in artists
-    }
+    thresholds = get_percentile_thresholds(popularity_values)
+    to_extract = dict(zip(
+        artists, [songs_count(p, thresholds) for p in popularity_values]
+    ))
     seen_tracks = set()
     all_tracks = []
     artist_to_count = {a: 0 for a in artists}
     debug_tracks_zero = {}
     click.echo("\n🎵 Fetching top tracks for each artist...")
-    for artist in tqdm(artists, desc="Fetching tracks"):
-        top_tracks = fetch_artist_top_tracks(sp, artist, debug=debug)
-        rejected_tracks = []
-        for track_id in top_tracks:
-            reason = None
+    artist_ids = {}
+    for artist in artists:
+        artist_id = get_strict_artist_id(artist, artist_info[artist])
+        if artist_id:
+            artist_ids[artist] = artist_id
+    artist_top_tracks = fetch_all_top_tracks(sp, artist_ids)
+    for artist in artists:
+        # Spotify occasionally repeats a track within the same top tracks list
+        top_tracks = list({track["id"]: track for track in artist_top_tracks.get(artist, [])}.values())
+        if debug and artist in artist_top_tracks:
+            print_debug("Artist '%s' top tracks: %s", artist, [track["id"] for track in top_tracks])
+        rejected_tracks = {"id": [], "reason": [], "authors": [], "owner": []} if debug else None
+        for track in top_tracks:
+            if artist_to_count[artist] >= to_extract[artist]:
+                break  # got enough songs for this artist
+            track_id = track["id"]
             if track_id in seen_tracks:
-                reason = "already assigned to previous artist"
-                rejected_tracks.append((track_id, reason, None, None))
+                if debug:
+                    add_rejected_track(rejected_tracks, track_id, "already assigned to previous artist")
                 continue  # already assigned
-            track_info = sp.track(track_id)
             # Find the first artist in track's authors that is in our artists list (accent/case-insensitive)
-            owner = None
-            authors = [auth["name"] for auth in track_info["artists"]]
-            for auth_name in authors:
-                norm_auth_name = normalize(auth_name)
-                if norm_auth_name in artist_preference:
-                    owner = artist_name_map[norm_auth_name]
-                    break
+            owner = next((
+                artists[artist_preference[norm_auth_name]]
+                for norm_auth_name in (normalize(auth["name"]) for auth in track["artists"])
+                if norm_auth_name in artist_preference
+            ), None)
             if owner != artist:
-                reason = f"owner is {owner if owner else 'None'}"
-                rejected_tracks.append((track_id, reason, authors, owner))
+                if debug:
+                    reason = f"owner is {owner if owner else 'None'}"
+                    authors = [auth["name"] for auth in track["artists"]]
+                    add_rejected_track(rejected_tracks, track_id, reason, authors, owner)
                 continue  # not the owner for this song
-            if artist_to_count[artist] < to_extract[artist]:
-                all_tracks.append(track_id)
-                seen_tracks.add(track_id)
-                artist_to_count[artist] += 1
-            else:
-                reason = "limit reached for artist"
-                rejected_tracks.append((track_id, reason, authors, owner))
-            if artist_to_count[artist] >= to_extract[artist]:
-                break  # got enough songs for this artist
+            all_tracks.append(track_id)
+            seen_tracks.add(track_id)
+            artist_to_count[artist] += 1
         if artist_to_count[artist] == 0 and debug:
             debug_tracks_zero[artist] = {
-                'top_tracks': top_tracks,
+                'top_tracks': [track["id"] for track in top_tracks],
                 'rejected': rejected_tracks
             }
-        if debug:
-            print_debug(f"{artist} | Popularity: {artist_popularity[artist]}, Tracks taken: {artist_to_count[artist]}", debug)
-        time.sleep(0.2)
+        print_debug("%s | Popularity: %s, Tracks taken: %s", artist, artist_popularity[artist], artist_to_count[artist])
     # Print debug for artists with 0 tracks
     if debug and debug_tracks_zero:
         click.echo("\n[DEBUG] Artists with no assigned tracks:")
         for artist, info in debug_tracks_zero.items():
             click.echo(f"\n  - {artist} (requested: {to_extract[artist]})")
-            for track_id, reason, authors, owner in info['rejected']:
+            for track_id, reason, authors, owner in zip(*info['rejected'].values()):
                 click.echo(f"    Track: {track_id}")
                 if authors:
                     click.echo(f"      Authors: {authors}")
@@ -236,11 +393,21 @@ def select_tracks_by_percentile_logic(sp, artists, debug=False):
 
 
 
+def chunked(iterable, size):
+    """Yields consecutive lists of at most size items"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 def add_tracks_to_playlist_with_progress(sp, playlist_id, tracks):
+    # Chunks are posted one after another: Spotify appends them in arrival order,
+    # so concurrent uploads would shuffle the playlist
     chunk_size = 100
     click.echo("Uploading tracks to Spotify...")
-    for i in tqdm(range(0, len(tracks), chunk_size), desc="Uploading"):
-        sp.playlist_add_items(playlist_id, tracks[i:i+chunk_size])
+    total = -(-len(tracks) // chunk_size)
+    for chunk in tqdm(chunked(tracks, chunk_size), total=total, desc="Uploading"):
+        spotify_limiter.wait()
+        sp.playlist_add_items(playlist_id, chunk)
         
 def create_playlist_cover_with_logo(festival_dir):
     """
@@ -279,7 +446,7 @@ def create_playlist_cover_with_logo(festival_dir):
     return jpeg_bytes
 
 
-def upload_playlist_cover(sp, playlist_id, festival_dir, debug=False):
+def upload_playlist_cover(sp, playlist_id, festival_dir):
     """
     Sets the playlist cover to the festival cover with the logo overlay.
     """
@@ -288,8 +455,7 @@ def upload_playlist_cover(sp, playlist_id, festival_dir, debug=False):
     img_base64 = base64.b64encode(jpeg_bytes).decode('utf-8')
     try:
         sp.playlist_upload_cover_image(playlist_id, img_base64)
-        if debug:
-            print_debug("Playlist cover uploaded successfully!", debug)
+        print_debug("Playlist cover uploaded successfully!")
     except Exception as e:
         click.echo(f"[ERROR] Failed to upload playlist cover: {e}")
         
@@ -318,10 +484,11 @@ from datetime import datetime
 @click.option('--festival', default=None, help="Festival directory name (will prompt if not set).")
 @click.option('--debug', is_flag=True, help="Enable debug mode with extra output.")
 def main(playlist_name, code, festival, debug):
-    print_debug("Starting HitTheFest CLI", debug)
+    enable_debug(debug)
+    print_debug("Starting HitTheFest CLI")
     # Festival selection
     if not festival:
-        selected_festival, artists = select_festival(debug=debug)
+        selected_festival, artists = select_festival()
     else:
         artists_path = get_artists_path(festival)
         is_valid, artists_or_err = validate_artists_json(artists_path)
@@ -329,6 +496,8 @@ def main(playlist_name, code, festival, debug):
             click.echo(f"Error: {artists_or_err}")
             sys.exit(1)
         selected_festival, artists = festival, artists_or_err
+    artists = tuple(artists)
+    artist_preference = get_artist_preference(artists)
 
     # Setup SpotifyOAuth object (needed for both auth url and token exchange)
     if not (SPOTIPY_CLIENT_ID and SPOTIPY_CLIENT_SECRET and SPOTIPY_REDIRECT_URI):
@@ -342,14 +511,14 @@ def main(playlist_name, code, festival, debug):
     )
 
     # Playlist name and Spotify code (show auth_url if needed)
-    playlist_name, code = ask_for_inputs(playlist_name, code, sp_oauth, debug=debug)
+    playlist_name, code = ask_for_inputs(playlist_name, code, sp_oauth)
 
     # Connect to Spotify
-    sp = create_spotify_client(code, sp_oauth, debug=debug)
+    sp = create_spotify_client(code, sp_oauth)
     user_id = sp.current_user()["id"]
 
     # Select tracks using notebook logic (percentile, no duplicates)
-    tracks_to_add, artist_popularity, to_extract = select_tracks_by_percentile_logic(sp, artists, debug=debug)
+    tracks_to_add, artist_popularity, to_extract = select_tracks_by_percentile_logic(sp, artists, artist_preference, debug=debug)
 
     print_summary(playlist_name, selected_festival, len(artists), len(tracks_to_add))
     confirm = click.prompt("Do you want to create and upload the playlist? [Y/n]", default="Y")
@@ -361,7 +530,7 @@ def main(playlist_name, code, festival, debug):
     desc = get_playlist_description()
     new_playlist = sp.user_playlist_create(user_id, playlist_name, description=desc)
 
-    upload_playlist_cover(sp, new_playlist["id"], selected_festival, debug=debug)
+    upload_playlist_cover(sp, new_playlist["id"], selected_festival)
     add_tracks_to_playlist_with_progress(sp, new_playlist["id"], tracks_to_add)
     click.echo(f"Playlist '{playlist_name}' created with {len(tracks_to_add)} tracks!")
 